@@ -11,510 +11,173 @@ Usage:
 """
 
 import os
+import re
 import sys
 import csv
+import codecs
 import argparse
+import heapq
 import webbrowser
-from datetime import datetime, timedelta, time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from html import escape
+from operator import itemgetter
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Tuple, Optional
-import json
+from typing import Any, Callable, DefaultDict, Dict, List, Tuple, Optional
 
 
-class ActivityReport:
-    """Parses CSV logs and generates work/break reports"""
-    
-    def __init__(self, logs_folder: Path):
-        self.logs_folder = logs_folder
-    
-    def get_log_path(self, date: datetime) -> Path:
-        """Get the CSV log file path for a specific date"""
-        return self.logs_folder / f"{date.strftime('%Y-%m-%d')}.csv"
-    
-    def parse_log(self, date: datetime) -> dict:
-        """Parse a daily log file and extract work/break periods"""
-        log_path = self.get_log_path(date)
-        
-        if not log_path.exists():
-            return {
-                'date': date,
-                'exists': False,
-                'start_time': None,
-                'end_time': None,
-                'total_work_seconds': 0,
-                'total_break_seconds': 0,
-                'periods': [],
-                'error': f"No log file found for {date.strftime('%Y-%m-%d')}"
-            }
-        
-        periods = []  # List of (start_time, end_time, type) where type is 'work' or 'break'
-        first_activity = None
-        last_activity = None
-        total_work_seconds = 0
-        app_stats = {}  # Dictionary to track time per application: {app_name: {total: seconds, windows: {title: seconds}}}
-        
-        current_session_start = None
-        in_work_session = False
-        session_started = False  # Track if we've seen a SESSION_START for today
-        current_process_date = date
-        
-        with open(log_path, 'r', encoding='utf-8-sig') as f:  # utf-8-sig handles BOM automatically
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                if row is None or not row:
-                    continue
-                    
-                start_str = (row.get('start') or '').strip()
-                process = (row.get('process') or '').strip()
-                
-                if not start_str:
-                    continue
-                
-                # Parse time
-                try:
-                    parsed_time = datetime.strptime(start_str, '%H:%M:%S').time()
-                except ValueError:
-                    continue
-                
-                # Handle midnight crossover (if time goes backwards, we moved to next day)
-                # This assumes log entries are chronological
-                if last_activity:
-                    last_time = last_activity.time()
-                    if parsed_time < last_time:
-                         # We crossed midnight, increment the base date for this and subsequent entries
-                         # but only if we haven't already moved to the next day for this specific crossover
-                         # (Logic: maintain current_process_date state)
-                         pass
+# Default number of window titles listed per application in the daily and weekly reports
+MAX_WINDOWS_PER_APP = 50
 
-                # We need to track the date for the current entry.
-                # Since we process sequentially, we can detect date changes.
-                # Initialize current_process_date at start of function.
-                
-                # REWRITE STRATEGY:
-                # We can't rely just on last_activity because last_activity is a datetime.
-                # we need to track the "current day offset" from the start date.
-                
-                # Let's use a simpler approach:
-                # 1. current_entry_dt = datetime.combine(current_process_date, parsed_time)
-                # 2. if current_entry_dt < last_activity: 
-                #       current_process_date += timedelta(days=1)
-                #       current_entry_dt = datetime.combine(current_process_date, parsed_time)
-                
-                current_entry_dt = datetime.combine(current_process_date, parsed_time)
-                
-                if last_activity and current_entry_dt < last_activity:
-                    # Time went backwards. Check if it's a significant jump (indicating next day)
-                    # or just minor jitter due to race conditions in logging (e.g. threads writing out of order)
-                    time_diff = last_activity - current_entry_dt
-                    if time_diff > timedelta(hours=12):
-                        # Significant jump back in time -> Midnight crossover -> Next Day
-                        current_process_date += timedelta(days=1)
-                        current_entry_dt = datetime.combine(current_process_date, parsed_time)
-                    else:
-                        # Minor jitter/out-of-order write. Keep timeline monotonic to avoid
-                        # negative durations when closing periods later.
-                        current_entry_dt = last_activity
+# Optional (initializer, initargs) run in each --jobs worker process before it parses logs.
+# run_report.py sets this so spawned workers load the same build of this module as the parent.
+worker_initializer: Optional[Tuple[Callable[..., Any], Tuple[Any, ...]]] = None
 
-                # Skip all entries until we see the first SESSION_START marker
-                # This handles midnight crossover - entries before SESSION_START are from previous day
-                if not session_started and process != 'SESSION_START':
-                    continue
-                
-                # Handle special markers
-                if process == 'SESSION_START':
-                    session_started = True  # Mark that we've started tracking today's session
-                    # Start of work session
-                    session_dt = current_entry_dt
-                    
-                    if current_session_start:
-                        if in_work_session:
-                            # Close previous work period (shouldn't happen, but be safe)
-                            periods.append((current_session_start, session_dt, 'work'))
-                        else:
-                            # Close previous break period
-                            periods.append((current_session_start, session_dt, 'break'))
-                    
-                    current_session_start = session_dt
-                    in_work_session = True
-                    
-                    if first_activity is None:
-                        first_activity = session_dt
-                    last_activity = session_dt
-                    
-                elif process == 'BREAK_START':
-                    # End of work session, start of break
-                    break_dt = current_entry_dt
-                    
-                    if current_session_start and in_work_session:
-                        periods.append((current_session_start, break_dt, 'work'))
-                        current_session_start = break_dt
-                        in_work_session = False
-                    else:
-                        # Break without session start (implicit break)
-                        current_session_start = break_dt
-                        in_work_session = False
-                    
-                    last_activity = break_dt
-                    
-                elif process == 'SESSION_END':
-                    # Explicit end of session
-                    end_dt = current_entry_dt
-                    
-                    if current_session_start:
-                        if in_work_session:
-                            periods.append((current_session_start, end_dt, 'work'))
-                        # No need to track break periods explicitly
-                    
-                    current_session_start = None
-                    in_work_session = False
-                    last_activity = end_dt
-                    
-                elif start_str.startswith('#TOTAL_ACTIVE_SEC') or process.startswith('#TOTAL_ACTIVE_SEC'):
-                    # End of day summary
-                    try:
-                        end_value = (row.get('end') or '0').strip()
-                        total_work_seconds = int(end_value)
-                    except (ValueError, AttributeError):
-                        pass
-                    
-                else:
-                    # Regular activity entry
-                    try:
-                        start_dt = current_entry_dt
-                        
-                        duration_str = (row.get('duration_sec') or '0').strip()
-                        duration = int(duration_str)
-                        
-                        # Track application statistics with window titles (only if session has started)
-                        if session_started and duration > 0:
-                            app_name = process.replace('.exe', '')  # Remove .exe extension
-                            title = (row.get('title') or '').strip()
-                            
-                            if app_name not in app_stats:
-                                app_stats[app_name] = {'total': 0, 'windows': {}}
-                            
-                            app_stats[app_name]['total'] += duration
-                            
-                            if title:
-                                if title not in app_stats[app_name]['windows']:
-                                    app_stats[app_name]['windows'][title] = 0
-                                app_stats[app_name]['windows'][title] += duration
-                        
-                        if first_activity is None:
-                            first_activity = start_dt
-                        if last_activity is None or start_dt > last_activity:
-                            last_activity = start_dt
-                        
-                    except (ValueError, TypeError, AttributeError):
-                        continue
-        
-        # Close any open session at end of file
-        if current_session_start:
-            end_of_day = last_activity or datetime.combine(date, time(23, 59, 59))
-            # For ongoing day, use current time as end
-            if date.date() == datetime.now().date():
-                end_of_day = datetime.now()
-            
-            if in_work_session:
-                periods.append((current_session_start, end_of_day, 'work'))
-            else:
-                # Still in break at end of day - this is normal
-                periods.append((current_session_start, end_of_day, 'break'))
-        
-        # Drop invalid/negative periods that may appear from out-of-order writes
-        periods = [
-            (start, end, period_type)
-            for start, end, period_type in periods
-            if end > start
-        ]
+# One timeline bar in the daily report, filled per period with str.format
+_PERIOD_TMPL = ('                    <div class="timeline-period {type}" style="left: {left}%; width: {width}%;" '
+                'title="{label}: {start} - {end} ({duration})"></div>\n')
 
-        # If no explicit total from #TOTAL_ACTIVE_SEC (ongoing day), calculate from periods
-        if total_work_seconds == 0 and periods:
-            for start, end, period_type in periods:
-                if period_type == 'work':
-                    total_work_seconds += int((end - start).total_seconds())
-        
-        # Calculate total break time based on gaps between work sessions (excluding huge gaps like night)
-        # 1. Identify all work intervals
-        work_intervals = sorted([
-            (p[0], p[1]) for p in periods if p[2] == 'work'
-        ], key=lambda x: x[0])
+# 'HH:MM:SS' start column (ASCII digits only, as strptime required); validated by the regex engine rather than via exceptions
+_TIME_RE = re.compile(r'([0-9]{1,2}):([0-9]{1,2}):([0-9]{1,2})')
 
-        total_break_seconds = 0
-        
-        if work_intervals:
-            # Update first/last activity based on actual work sessions
-            first_activity = work_intervals[0][0]
-            last_activity = work_intervals[-1][1]
+# Session marker rows written by ActivityLogger (process column), mapped to dispatch codes
+MARKER_NONE, MARKER_SESSION_START, MARKER_BREAK_START, MARKER_SESSION_END = range(4)
+SESSION_MARKERS = {
+    'SESSION_START': MARKER_SESSION_START,
+    'BREAK_START': MARKER_BREAK_START,
+    'SESSION_END': MARKER_SESSION_END,
+}
 
-            # Calculate gaps between consecutive work sessions
-            for i in range(len(work_intervals) - 1):
-                end_current = work_intervals[i][1]
-                start_next = work_intervals[i+1][0]
-                
-                gap = (start_next - end_current).total_seconds()
-                
-                # If gap is huge (e.g. > 4 hours), treat as "Off work" (Night), don't count as break
-                if 0 < gap < (4 * 3600):
-                    total_break_seconds += int(gap)
-                else:
-                    # Treat > 4h gap as non-working time, not break
-                    pass
-        else:
-             # Fallback if no work periods found (should be rare)
-             if first_activity and last_activity:
-                 # For ongoing day, use current time as last_activity
-                 if date.date() == datetime.now().date():
-                     last_activity = max(last_activity, datetime.now())
-                 
-                 total_day_seconds = (last_activity - first_activity).total_seconds()
-                 total_break_seconds = max(0, int(total_day_seconds - total_work_seconds))
 
-        # Reconcile app totals with total work time.
-        # App stats are based on flushed window samples, while total work time may include
-        # still-open active work that has not been flushed to CSV yet.
-        total_app_seconds = sum(app_data['total'] for app_data in app_stats.values())
-        unattributed_seconds = max(0, total_work_seconds - total_app_seconds)
-        if unattributed_seconds > 0:
-            unattributed_key = 'Unattributed active time'
-            if unattributed_key not in app_stats:
-                app_stats[unattributed_key] = {'total': 0, 'windows': {}}
-            app_stats[unattributed_key]['total'] += unattributed_seconds
+def _pct(num: int, den: int, decimals: int = 2) -> str:
+    """Format num/den as a percentage with fixed decimals using integer arithmetic only"""
+    if den <= 0:
+        return f"0.{'0' * decimals}"
+    scale = 10 ** decimals
+    value = (num * 100 * scale * 2 + den) // (2 * den)  # Round half up
+    whole, frac = divmod(value, scale)
+    return f"{whole}.{frac:0{decimals}d}"
 
-            # Use a synthetic window title to make the source of this time explicit in UI.
-            note_title = 'Open active window (not flushed to log yet)'
-            if note_title not in app_stats[unattributed_key]['windows']:
-                app_stats[unattributed_key]['windows'][note_title] = 0
-            app_stats[unattributed_key]['windows'][note_title] += unattributed_seconds
-        
-        return {
-            'date': date,
-            'exists': True,
-            'start_time': first_activity,
-            'end_time': last_activity,
-            'total_work_seconds': total_work_seconds,
-            'total_break_seconds': total_break_seconds,
-            'periods': periods,
-            'app_stats': app_stats,
-            'error': None
-        }
-    
-    def format_duration(self, seconds: int) -> str:
-        """Format seconds as HH:MM:SS"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    
-    def parse_week(self, start_date: datetime) -> dict:
-        """Parse logs for a week (7 days starting from start_date)"""
-        daily_reports = []
-        weekly_app_stats = {}
-        total_work_seconds = 0
-        total_break_seconds = 0
-        
-        for day_offset in range(7):
-            current_date = start_date + timedelta(days=day_offset)
-            day_data = self.parse_log(current_date)
-            daily_reports.append(day_data)
-            
-            if day_data['exists'] and not day_data.get('error'):
-                total_work_seconds += day_data['total_work_seconds']
-                total_break_seconds += day_data['total_break_seconds']
-                
-                # Aggregate app statistics
-                if day_data.get('app_stats'):
-                    for app_name, app_data in day_data['app_stats'].items():
-                        if app_name not in weekly_app_stats:
-                            weekly_app_stats[app_name] = {'total': 0, 'windows': {}}
-                        
-                        weekly_app_stats[app_name]['total'] += app_data['total']
-                        
-                        # Aggregate window titles
-                        for title, seconds in app_data['windows'].items():
-                            if title not in weekly_app_stats[app_name]['windows']:
-                                weekly_app_stats[app_name]['windows'][title] = 0
-                            weekly_app_stats[app_name]['windows'][title] += seconds
-        
-        return {
-            'start_date': start_date,
-            'end_date': start_date + timedelta(days=6),
-            'daily_reports': daily_reports,
-            'total_work_seconds': total_work_seconds,
-            'total_break_seconds': total_break_seconds,
-            'app_stats': weekly_app_stats
-        }
-    
-    def generate_html_report(self, report_data: dict, output_path: Path):
-        """Generate an HTML report matching the screenshot design"""
-        
-        # Prepare timeline data (logical day: 03:00 -> 03:00 next day)
-        timeline_data = []
-        timeline_start_hour = 3
-        timeline_window_start = datetime.combine(report_data['date'].date(), time(hour=timeline_start_hour))
-        timeline_window_end = timeline_window_start + timedelta(days=1)
 
-        if report_data['periods']:
-            for start, end, period_type in report_data['periods']:
-                # Keep only the portion that belongs to the selected calendar day.
-                clipped_start = max(start, timeline_window_start)
-                clipped_end = min(end, timeline_window_end)
+# HTML-escape app names and window titles; titles repeat heavily, so escape each distinct one once
+_esc = lru_cache(maxsize=8192)(escape)
 
-                if clipped_end <= clipped_start:
-                    continue
 
-                timeline_data.append({
-                    'start': clipped_start.strftime('%H:%M:%S'),
-                    'end': clipped_end.strftime('%H:%M:%S'),
-                    'start_minutes': (clipped_start - timeline_window_start).total_seconds() / 60,
-                    'end_minutes': (clipped_end - timeline_window_start).total_seconds() / 60,
-                    'duration': self.format_duration(int((clipped_end - clipped_start).total_seconds())),
-                    'type': period_type
-                })
-        
-        # Prepare app statistics data
-        app_stats_list = []
-        if report_data.get('app_stats'):
-            # Sort by time descending
-            sorted_apps = sorted(report_data['app_stats'].items(), key=lambda x: x[1]['total'], reverse=True)
-            total_app_time = sum(app['total'] for app in report_data['app_stats'].values())
-            
-            for app_name, app_data in sorted_apps:
-                seconds = app_data['total']
-                if seconds > 0:  # Only show apps with recorded time
-                    percentage = (seconds / total_app_time * 100) if total_app_time > 0 else 0
-                    
-                    # Sort window titles by time
-                    windows = []
-                    for title, title_seconds in sorted(app_data['windows'].items(), key=lambda x: x[1], reverse=True):
-                        title_percentage = (title_seconds / seconds * 100) if seconds > 0 else 0
-                        windows.append({
-                            'title': title,
-                            'seconds': title_seconds,
-                            'formatted_time': self.format_duration(title_seconds),
-                            'percentage': title_percentage
-                        })
-                    
-                    app_stats_list.append({
-                        'name': app_name,
-                        'seconds': seconds,
-                        'formatted_time': self.format_duration(seconds),
-                        'percentage': percentage,
-                        'windows': windows
-                    })
-        
-        # Generate HTML
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Work / Break Report - {report_data['date'].strftime('%Y-%m-%d')}</title>
-    <style>
-        * {{
+def _unquote_csv_field(field: str) -> str:
+    """Undo ActivityLogger.CsvEscape quoting for a single field"""
+    if len(field) >= 2 and field[0] == '"' and field[-1] == '"':
+        return field[1:-1].replace('""', '"')
+    return field
+
+
+# Static stylesheet for the daily report, emitted verbatim
+_DAILY_REPORT_CSS = """    <style>
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #1e1e2e 0%, #2a2a3e 100%);
             color: #e0e0e0;
             padding: 20px;
             min-height: 100vh;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 28px;
             margin-bottom: 30px;
             color: #ffffff;
             font-weight: 400;
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: rgba(40, 40, 60, 0.6);
             border: 1px solid rgba(100, 100, 120, 0.3);
             border-radius: 8px;
             padding: 20px;
             backdrop-filter: blur(10px);
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 13px;
             color: #a0a0b0;
             margin-bottom: 8px;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 32px;
             color: #ffffff;
             font-weight: 300;
             font-family: 'Consolas', 'Courier New', monospace;
-        }}
+        }
         
-        .timeline-container {{
+        .timeline-container {
             background: rgba(40, 40, 60, 0.6);
             border: 1px solid rgba(100, 100, 120, 0.3);
             border-radius: 8px;
             padding: 30px;
             backdrop-filter: blur(10px);
-        }}
+        }
         
-        .timeline-wrapper {{
+        .timeline-wrapper {
             position: relative;
             height: 60px;
             margin-top: 20px;
-        }}
+        }
         
-        .timeline-bar {{
+        .timeline-bar {
             position: relative;
             width: 100%;
             height: 40px;
             background: rgba(30, 30, 40, 0.8);
             border-radius: 4px;
             overflow: visible;
-        }}
+        }
         
-        .timeline-period {{
+        .timeline-period {
             position: absolute;
             height: 100%;
             top: 0;
             border-radius: 2px;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .timeline-period.work {{
+        .timeline-period.work {
             background: linear-gradient(90deg, #4ade80 0%, #22c55e 100%);
             box-shadow: 0 2px 8px rgba(34, 197, 94, 0.3);
-        }}
+        }
         
-        .timeline-period.break {{
+        .timeline-period.break {
             background: linear-gradient(90deg, #fbbf24 0%, #f59e0b 100%);
             box-shadow: 0 2px 8px rgba(251, 191, 36, 0.3);
-        }}
+        }
         
-        .timeline-period:hover {{
+        .timeline-period:hover {
             transform: scaleY(1.1);
             z-index: 10;
-        }}
+        }
         
-        .timeline-labels {{
+        .timeline-labels {
             position: relative;
             width: 100%;
             height: 16px;
@@ -522,83 +185,83 @@ class ActivityReport:
             font-size: 11px;
             color: #808090;
             font-family: 'Consolas', monospace;
-        }}
+        }
         
-        .timeline-label {{
+        .timeline-label {
             position: absolute;
             transform: translateX(-50%);
             white-space: nowrap;
-        }}
+        }
 
-        .timeline-label.start {{
+        .timeline-label.start {
             transform: none;
-        }}
+        }
 
-        .timeline-label.end {{
+        .timeline-label.end {
             transform: translateX(-100%);
-        }}
+        }
         
-        .note {{
+        .note {
             margin-top: 20px;
             font-size: 12px;
             color: #808090;
             font-style: italic;
-        }}
+        }
         
-        .error {{
+        .error {
             background: rgba(220, 38, 38, 0.1);
             border: 1px solid rgba(220, 38, 38, 0.3);
             color: #fca5a5;
             padding: 20px;
             border-radius: 8px;
             margin-top: 20px;
-        }}
+        }
         
-        .legend {{
+        .legend {
             display: flex;
             gap: 30px;
             margin-top: 20px;
             font-size: 13px;
-        }}
+        }
         
-        .legend-item {{
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
         
-        .legend-color {{
+        .legend-color {
             width: 20px;
             height: 12px;
             border-radius: 2px;
-        }}
+        }
         
-        .legend-color.work {{
+        .legend-color.work {
             background: linear-gradient(90deg, #4ade80 0%, #22c55e 100%);
-        }}
+        }
         
-        .legend-color.break {{
+        .legend-color.break {
             background: linear-gradient(90deg, #fbbf24 0%, #f59e0b 100%);
-        }}
+        }
         
-        .app-stats {{
+        .app-stats {
             margin-top: 40px;
-        }}
+        }
         
-        .app-stats h2 {{
+        .app-stats h2 {
             font-size: 20px;
             color: #ffffff;
             font-weight: 400;
             margin-bottom: 20px;
-        }}
+        }
         
-        .app-list {{
+        .app-list {
             display: grid;
             gap: 8px;
             overflow: hidden;
-        }}
+        }
         
-        .app-item {{
+        .app-item {
             display: flex;
             align-items: center;
             background: rgba(50, 50, 70, 0.4);
@@ -610,31 +273,31 @@ class ActivityReport:
             min-width: 0;
             max-width: 100%;
             overflow: hidden;
-        }}
+        }
         
-        .app-item:hover {{
+        .app-item:hover {
             background: rgba(60, 60, 80, 0.6);
-        }}
+        }
         
-        .app-item.expanded {{
+        .app-item.expanded {
             border-bottom-left-radius: 0;
             border-bottom-right-radius: 0;
-        }}
+        }
         
-        .expand-icon {{
+        .expand-icon {
             margin-right: 12px;
             color: #808090;
             transition: transform 0.2s ease;
             font-size: 12px;
             width: 12px;
             flex-shrink: 0;
-        }}
+        }
         
-        .app-item.expanded .expand-icon {{
+        .app-item.expanded .expand-icon {
             transform: rotate(90deg);
-        }}
+        }
         
-        .app-name {{
+        .app-name {
             flex: 1;
             color: #e0e0e0;
             font-size: 14px;
@@ -644,9 +307,9 @@ class ActivityReport:
             min-width: 0;
             max-width: 600px;
             flex-basis: 0;
-        }}
+        }
         
-        .app-time {{
+        .app-time {
             color: #a0a0b0;
             font-family: 'Consolas', monospace;
             font-size: 13px;
@@ -654,9 +317,9 @@ class ActivityReport:
             flex-shrink: 0;
             min-width: 70px;
             width: 70px;
-        }}
+        }
         
-        .app-bar {{
+        .app-bar {
             width: 200px;
             height: 20px;
             background: rgba(30, 30, 40, 0.8);
@@ -664,16 +327,16 @@ class ActivityReport:
             overflow: hidden;
             position: relative;
             flex-shrink: 0;
-        }}
+        }
         
-        .app-bar-fill {{
+        .app-bar-fill {
             height: 100%;
             background: linear-gradient(90deg, #6366f1 0%, #8b5cf6 100%);
             border-radius: 10px;
             transition: width 0.3s ease;
-        }}
+        }
         
-        .app-percentage {{
+        .app-percentage {
             color: #808090;
             font-size: 12px;
             margin-left: 12px;
@@ -681,9 +344,9 @@ class ActivityReport:
             width: 50px;
             text-align: right;
             flex-shrink: 0;
-        }}
+        }
         
-        .window-details {{
+        .window-details {
             display: none;
             background: rgba(40, 40, 60, 0.6);
             border-bottom-left-radius: 6px;
@@ -692,13 +355,13 @@ class ActivityReport:
             padding: 8px 16px 12px 16px;
             margin-top: -6px;
             overflow: hidden;
-        }}
+        }
         
-        .window-details.visible {{
+        .window-details.visible {
             display: block;
-        }}
+        }
         
-        .window-item {{
+        .window-item {
             display: flex;
             align-items: center;
             padding: 8px 12px;
@@ -708,9 +371,9 @@ class ActivityReport:
             min-width: 0;
             max-width: 100%;
             overflow: hidden;
-        }}
+        }
         
-        .window-title {{
+        .window-title {
             flex: 1;
             color: #b0b0c0;
             font-size: 13px;
@@ -721,9 +384,9 @@ class ActivityReport:
             min-width: 0;
             max-width: 500px;
             flex-basis: 0;
-        }}
+        }
         
-        .window-time {{
+        .window-time {
             color: #808090;
             font-family: 'Consolas', monospace;
             font-size: 12px;
@@ -731,24 +394,24 @@ class ActivityReport:
             flex-shrink: 0;
             min-width: 65px;
             width: 65px;
-        }}
+        }
         
-        .window-bar {{
+        .window-bar {
             width: 150px;
             height: 16px;
             background: rgba(20, 20, 30, 0.8);
             border-radius: 8px;
             overflow: hidden;
             flex-shrink: 0;
-        }}
+        }
         
-        .window-bar-fill {{
+        .window-bar-fill {
             height: 100%;
             background: linear-gradient(90deg, #06b6d4 0%, #0891b2 100%);
             border-radius: 8px;
-        }}
+        }
         
-        .window-percentage {{
+        .window-percentage {
             color: #707080;
             font-size: 11px;
             margin-left: 10px;
@@ -756,321 +419,143 @@ class ActivityReport:
             width: 45px;
             text-align: right;
             flex-shrink: 0;
-        }}
+        }
         
-        @media print {{
-            body {{
+        @media print {
+            body {
                 background: white;
                 color: black;
-            }}
-            .stat-card, .timeline-container {{
+            }
+            .stat-card, .timeline-container {
                 background: white;
                 border: 1px solid #ccc;
-            }}
-        }}
+            }
+        }
     </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Work / Break Report</h1>
+"""
+
+
+# Static stylesheet for the weekly report, emitted verbatim
+_WEEKLY_REPORT_CSS = """    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
         
-        {"<div class='error'>" + report_data.get('error', '') + "</div>" if report_data.get('error') else ""}
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #1e1e2e 0%, #2a2a3e 100%);
+            color: #e0e0e0;
+            padding: 20px;
+            min-height: 100vh;
+        }
         
-        {"" if report_data.get('error') else f'''
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-label">Start Time</div>
-                <div class="stat-value">{report_data['start_time'].strftime('%H:%M:%S') if report_data['start_time'] else '—'}</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-label">End Time</div>
-                <div class="stat-value">{report_data['end_time'].strftime('%H:%M:%S') if report_data['end_time'] else '—'}</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-label">Total Work Time</div>
-                <div class="stat-value">{self.format_duration(report_data['total_work_seconds'])}</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-label">Total Break Time</div>
-                <div class="stat-value">{self.format_duration(report_data['total_break_seconds'])}</div>
-            </div>
-        </div>
-        
-        <div class="timeline-container">
-            <div class="timeline-wrapper">
-                <div class="timeline-bar">
-                    {"".join([
-                        f'<div class="timeline-period {period["type"]}" '
-                        f'style="left: {(period["start_minutes"] / 1440) * 100:.2f}%; '
-                        f'width: {((period["end_minutes"] - period["start_minutes"]) / 1440) * 100:.2f}%;" '
-                        f'title="{period["type"].title()}: {period["start"]} - {period["end"]} ({period["duration"]})"></div>'
-                        for period in timeline_data
-                    ])}
-                </div>
-            </div>
-            
-            <div class="timeline-labels">
-                {"".join([
-                    (
-                        f'<div class="timeline-label start" style="left: {(h / 24) * 100:.4f}%;">{((timeline_start_hour + h) % 24):02d}:00</div>'
-                        if h == 0 else
-                        f'<div class="timeline-label end" style="left: {(h / 24) * 100:.4f}%;">{((timeline_start_hour + h) % 24):02d}:00</div>'
-                        if h == 24 else
-                        f'<div class="timeline-label" style="left: {(h / 24) * 100:.4f}%;">{((timeline_start_hour + h) % 24):02d}:00</div>'
-                    )
-                    for h in range(0, 25, 1)
-                ])}
-            </div>
-            
-            <div class="legend">
-                <div class="legend-item">
-                    <div class="legend-color work"></div>
-                    <span>Work Time</span>
-                </div>
-                <div class="legend-item">
-                    <div class="legend-color break"></div>
-                    <span>Break Time</span>
-                </div>
-            </div>
-            
-            <div class="note">
-                Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-                {'• Capped at now: ' + datetime.now().strftime('%H:%M:%S') + ' • Breaks after the last break start are excluded (day ended).' if report_data['end_time'] and report_data['end_time'].date() == datetime.now().date() else ''}
-            </div>
-        </div>
-        
-        {"" if not app_stats_list else f'''
-        <div class="timeline-container app-stats">
-            <h2>📊 Application Usage Statistics</h2>
-            <div class="app-list">
-                {"".join([
-                    f'''<div>
-                    <div class="app-item" onclick="toggleAppDetails(this)">
-                        <span class="expand-icon">▶</span>
-                        <div class="app-name" title="{app["name"]}">{app["name"]}</div>
-                        <div class="app-time">{app["formatted_time"]}</div>
-                        <div class="app-bar">
-                            <div class="app-bar-fill" style="width: {app["percentage"]:.1f}%;"></div>
-                        </div>
-                        <div class="app-percentage">{app["percentage"]:.1f}%</div>
-                    </div>
-                    {"" if not app["windows"] else f'''<div class="window-details">
-                        {"".join([
-                            f'''<div class="window-item">
-                                <div class="window-title" title="{window["title"]}">{window["title"]}</div>
-                                <div class="window-time">{window["formatted_time"]}</div>
-                                <div class="window-bar">
-                                    <div class="window-bar-fill" style="width: {window["percentage"]:.1f}%;"></div>
-                                </div>
-                                <div class="window-percentage">{window["percentage"]:.1f}%</div>
-                            </div>'''
-                            for window in app["windows"]
-                        ])}
-                    </div>'''}
-                </div>'''
-                    for app in app_stats_list
-                ])}
-            </div>
-        </div>
-        
-        <script>
-            function toggleAppDetails(element) {{
-                element.classList.toggle('expanded');
-                const details = element.nextElementSibling;
-                if (details && details.classList.contains('window-details')) {{
-                    details.classList.toggle('visible');
-                }}
-            }}
-        </script>
-        '''}
-        '''}
-    </div>
-</body>
-</html>
-"""
-        
-        # Write HTML file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return output_path
-    
-    def generate_weekly_html_report(self, week_data: dict, output_path: Path):
-        """Generate a weekly HTML report"""
-        
-        # Prepare daily summary data
-        daily_summaries = []
-        for day_data in week_data['daily_reports']:
-            if day_data['exists'] and not day_data.get('error'):
-                daily_summaries.append({
-                    'date': day_data['date'].strftime('%Y-%m-%d'),
-                    'weekday': day_data['date'].strftime('%A'),
-                    'work_time': self.format_duration(day_data['total_work_seconds']),
-                    'break_time': self.format_duration(day_data['total_break_seconds']),
-                    'work_seconds': day_data['total_work_seconds'],
-                    'break_seconds': day_data['total_break_seconds']
-                })
-        
-        # Prepare app statistics data
-        app_stats_list = []
-        if week_data.get('app_stats'):
-            sorted_apps = sorted(week_data['app_stats'].items(), key=lambda x: x[1]['total'], reverse=True)
-            total_app_time = sum(app['total'] for app in week_data['app_stats'].values())
-            
-            for app_name, app_data in sorted_apps:
-                seconds = app_data['total']
-                if seconds > 0:
-                    percentage = (seconds / total_app_time * 100) if total_app_time > 0 else 0
-                    
-                    windows = []
-                    for title, title_seconds in sorted(app_data['windows'].items(), key=lambda x: x[1], reverse=True):
-                        title_percentage = (title_seconds / seconds * 100) if seconds > 0 else 0
-                        windows.append({
-                            'title': title,
-                            'seconds': title_seconds,
-                            'formatted_time': self.format_duration(title_seconds),
-                            'percentage': title_percentage
-                        })
-                    
-                    app_stats_list.append({
-                        'name': app_name,
-                        'seconds': seconds,
-                        'formatted_time': self.format_duration(seconds),
-                        'percentage': percentage,
-                        'windows': windows
-                    })
-        
-        # Generate HTML (reuse styles from daily report)
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Weekly Work/Break Report - {week_data['start_date'].strftime('%Y-%m-%d')} to {week_data['end_date'].strftime('%Y-%m-%d')}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #1e1e2e 0%, #2a2a3e 100%);
-            color: #e0e0e0;
-            padding: 20px;
-            min-height: 100vh;
-        }}
-        
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 28px;
             margin-bottom: 10px;
             color: #ffffff;
             font-weight: 400;
-        }}
+        }
         
-        .week-range {{
+        .week-range {
             font-size: 16px;
             color: #a0a0b0;
             margin-bottom: 30px;
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: rgba(40, 40, 60, 0.6);
             border: 1px solid rgba(100, 100, 120, 0.3);
             border-radius: 8px;
             padding: 20px;
             backdrop-filter: blur(10px);
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 13px;
             color: #a0a0b0;
             margin-bottom: 8px;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 32px;
             color: #ffffff;
             font-weight: 300;
             font-family: 'Consolas', 'Courier New', monospace;
-        }}
+        }
         
-        .daily-container {{
+        .daily-container {
             background: rgba(40, 40, 60, 0.6);
             border: 1px solid rgba(100, 100, 120, 0.3);
             border-radius: 8px;
             padding: 30px;
             backdrop-filter: blur(10px);
             margin-bottom: 40px;
-        }}
+        }
         
-        h2 {{
+        h2 {
             font-size: 20px;
             color: #ffffff;
             font-weight: 400;
             margin-bottom: 20px;
-        }}
+        }
         
-        .daily-table {{
+        .daily-table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
         
-        .daily-table th {{
+        .daily-table th {
             text-align: left;
             padding: 12px;
             color: #a0a0b0;
             font-size: 13px;
             font-weight: 400;
             border-bottom: 1px solid rgba(100, 100, 120, 0.3);
-        }}
+        }
         
-        .daily-table td {{
+        .daily-table td {
             padding: 12px;
             color: #e0e0e0;
             font-size: 14px;
             border-bottom: 1px solid rgba(100, 100, 120, 0.2);
-        }}
+        }
         
-        .daily-table td.mono {{
+        .daily-table td.mono {
             font-family: 'Consolas', monospace;
             color: #a0a0b0;
-        }}
+        }
         
-        .daily-table tr:hover {{
+        .daily-table tr:hover {
             background: rgba(50, 50, 70, 0.3);
-        }}
+        }
         
-        .app-stats {{
+        .app-stats {
             margin-top: 0;
-        }}
+        }
         
-        .app-list {{
+        .app-list {
             display: grid;
             gap: 8px;
             overflow: hidden;
-        }}
+        }
         
-        .app-item {{
+        .app-item {
             display: flex;
             align-items: center;
             background: rgba(50, 50, 70, 0.4);
@@ -1082,31 +567,31 @@ class ActivityReport:
             min-width: 0;
             max-width: 100%;
             overflow: hidden;
-        }}
+        }
         
-        .app-item:hover {{
+        .app-item:hover {
             background: rgba(60, 60, 80, 0.6);
-        }}
+        }
         
-        .app-item.expanded {{
+        .app-item.expanded {
             border-bottom-left-radius: 0;
             border-bottom-right-radius: 0;
-        }}
+        }
         
-        .expand-icon {{
+        .expand-icon {
             margin-right: 12px;
             color: #808090;
             transition: transform 0.2s ease;
             font-size: 12px;
             width: 12px;
             flex-shrink: 0;
-        }}
+        }
         
-        .app-item.expanded .expand-icon {{
+        .app-item.expanded .expand-icon {
             transform: rotate(90deg);
-        }}
+        }
         
-        .app-name {{
+        .app-name {
             flex: 1;
             color: #e0e0e0;
             font-size: 14px;
@@ -1116,9 +601,9 @@ class ActivityReport:
             min-width: 0;
             max-width: 600px;
             flex-basis: 0;
-        }}
+        }
         
-        .app-time {{
+        .app-time {
             color: #a0a0b0;
             font-family: 'Consolas', monospace;
             font-size: 13px;
@@ -1126,9 +611,9 @@ class ActivityReport:
             flex-shrink: 0;
             min-width: 70px;
             width: 70px;
-        }}
+        }
         
-        .app-bar {{
+        .app-bar {
             width: 200px;
             height: 20px;
             background: rgba(30, 30, 40, 0.8);
@@ -1136,16 +621,16 @@ class ActivityReport:
             overflow: hidden;
             position: relative;
             flex-shrink: 0;
-        }}
+        }
         
-        .app-bar-fill {{
+        .app-bar-fill {
             height: 100%;
             background: linear-gradient(90deg, #6366f1 0%, #8b5cf6 100%);
             border-radius: 10px;
             transition: width 0.3s ease;
-        }}
+        }
         
-        .app-percentage {{
+        .app-percentage {
             color: #808090;
             font-size: 12px;
             margin-left: 12px;
@@ -1153,9 +638,9 @@ class ActivityReport:
             width: 50px;
             text-align: right;
             flex-shrink: 0;
-        }}
+        }
         
-        .window-details {{
+        .window-details {
             display: none;
             background: rgba(40, 40, 60, 0.6);
             border-bottom-left-radius: 6px;
@@ -1164,13 +649,13 @@ class ActivityReport:
             padding: 8px 16px 12px 16px;
             margin-top: -6px;
             overflow: hidden;
-        }}
+        }
         
-        .window-details.visible {{
+        .window-details.visible {
             display: block;
-        }}
+        }
         
-        .window-item {{
+        .window-item {
             display: flex;
             align-items: center;
             padding: 8px 12px;
@@ -1180,9 +665,9 @@ class ActivityReport:
             min-width: 0;
             max-width: 100%;
             overflow: hidden;
-        }}
+        }
         
-        .window-title {{
+        .window-title {
             flex: 1;
             color: #b0b0c0;
             font-size: 13px;
@@ -1193,9 +678,9 @@ class ActivityReport:
             min-width: 0;
             max-width: 500px;
             flex-basis: 0;
-        }}
+        }
         
-        .window-time {{
+        .window-time {
             color: #808090;
             font-family: 'Consolas', monospace;
             font-size: 12px;
@@ -1203,24 +688,24 @@ class ActivityReport:
             flex-shrink: 0;
             min-width: 65px;
             width: 65px;
-        }}
+        }
         
-        .window-bar {{
+        .window-bar {
             width: 150px;
             height: 16px;
             background: rgba(20, 20, 30, 0.8);
             border-radius: 8px;
             overflow: hidden;
             flex-shrink: 0;
-        }}
+        }
         
-        .window-bar-fill {{
+        .window-bar-fill {
             height: 100%;
             background: linear-gradient(90deg, #06b6d4 0%, #0891b2 100%);
             border-radius: 8px;
-        }}
+        }
         
-        .window-percentage {{
+        .window-percentage {
             color: #707080;
             font-size: 11px;
             margin-left: 10px;
@@ -1228,20 +713,682 @@ class ActivityReport:
             width: 45px;
             text-align: right;
             flex-shrink: 0;
-        }}
+        }
         
-        .note {{
+        .note {
             margin-top: 20px;
             font-size: 12px;
             color: #808090;
             font-style: italic;
-        }}
+        }
     </style>
-</head>
+"""
+
+
+class ActivityReport:
+    """Parses CSV logs and generates work/break reports"""
+    
+    def __init__(self, logs_folder: Path):
+        self.logs_folder = logs_folder
+    
+    def get_log_path(self, date: datetime) -> Path:
+        """Get the CSV log file path for a specific date"""
+        return self.logs_folder / f"{date.strftime('%Y-%m-%d')}.csv"
+    
+    def parse_log(self, date: datetime) -> Dict[str, Any]:
+        """Parse a daily log file and extract work/break periods"""
+        log_path = self.get_log_path(date)
+        
+        if not log_path.exists():
+            return {
+                'date': date,
+                'exists': False,
+                'start_time': None,
+                'end_time': None,
+                'total_work_seconds': 0,
+                'total_break_seconds': 0,
+                'periods': [],
+                'period_seconds': [],
+                'error': f"No log file found for {date.strftime('%Y-%m-%d')}"
+            }
+        
+        # All timestamps are tracked as integer seconds from midnight of the report date
+        # (entries past midnight get +86400); datetimes are only built for the result.
+        day_start = datetime(date.year, date.month, date.day)
+        now = datetime.now()  # Sampled once so every "ongoing day" cap agrees
+        is_today = date.date() == now.date()
+        now_s = (now - day_start) // timedelta(seconds=1)
+        periods: List[Tuple[int, int, str]] = []  # (start_s, end_s, type) where type is 'work' or 'break'
+        first_activity: Optional[int] = None
+        last_activity: Optional[int] = None
+        total_work_seconds = 0
+        # Dictionary to track time per application: {app_name: {total: seconds, windows: {title: seconds}}}
+        app_stats: DefaultDict[str, Dict[str, Any]] = defaultdict(lambda: {'total': 0, 'windows': defaultdict(int)})
+        
+        current_session_start: Optional[int] = None
+        in_work_session = False
+        session_started = False  # Track if we've seen a SESSION_START for today
+        day_offset = 0  # Seconds to add for each midnight crossed since the report date
+        time_cache: Dict[str, int] = {}  # Raw 'HH:MM:SS' string -> seconds from midnight
+        
+        # Read the whole log at once and split it ourselves - the logger writes a fixed,
+        # simple schema, so the csv module is only needed for the rare rows quoted before the title
+        # ActivityLogger writes a UTF-8 BOM; strip it from the bytes and decode as plain UTF-8
+        text = log_path.read_bytes().removeprefix(codecs.BOM_UTF8).decode('utf-8')
+        header_line, _, body = text.partition('\n')
+        lines = body.split('\n')
+        
+        # Resolve column positions once from the header
+        header = [column.strip() for column in header_line.split(',')]
+        column_count = len(header)
+        try:
+            idx_start = header.index('start')
+            idx_end = header.index('end')
+            idx_duration = header.index('duration_sec')
+            idx_process = header.index('process')
+            idx_title = header.index('title')
+        except ValueError:
+            # Missing or malformed header - nothing to parse
+            lines = []
+            idx_start = idx_end = idx_duration = idx_process = idx_title = 0
+        idx_max = max(idx_start, idx_end, idx_duration, idx_process, idx_title)
+        title_is_last = idx_title == column_count - 1
+        
+        for line in lines:
+            # Cap the split at the last column so a trailing title keeps its commas verbatim
+            row = line.split(',', column_count - 1)
+            # Any other quoted field (e.g. a process name with a comma) needs the full csv rules
+            if '"' in line and (not title_is_last or line.find('"', 0, len(line) - len(row[-1])) != -1):
+                row = next(csv.reader((line,)), [])
+                title_quoted = False
+            else:
+                title_quoted = title_is_last
+            # Short rows are skipped here, including ActivityLogger's two-field
+            # '#TOTAL_ACTIVE_SEC,<n>' summary - work time is derived from the periods instead
+            if len(row) <= idx_max:
+                continue
+                
+            start_str = row[idx_start].strip()
+            process = row[idx_process].strip()
+            
+            if not start_str:
+                continue
+            
+            # Parse time (memoized - timestamps repeat heavily within a log)
+            second_of_day = time_cache.get(start_str)
+            if second_of_day is None:
+                match = _TIME_RE.fullmatch(start_str)
+                if match is None:
+                    continue
+                hour, minute, second = map(int, match.groups())
+                if hour > 23 or minute > 59 or second > 59:
+                    continue
+                second_of_day = hour * 3600 + minute * 60 + second
+                time_cache[start_str] = second_of_day
+            
+            # Handle midnight crossover (if time goes backwards, we moved to next day)
+            # This assumes log entries are chronological
+
+            # We need to track the day offset for the current entry.
+            # Since we process sequentially, we can detect date changes:
+            # 1. current_entry_s = day_offset + second_of_day
+            # 2. if current_entry_s < last_activity: 
+            #       day_offset += 86400
+            #       current_entry_s = day_offset + second_of_day
+            
+            current_entry_s = day_offset + second_of_day
+            
+            if last_activity is not None and current_entry_s < last_activity:
+                # Time went backwards. Check if it's a significant jump (indicating next day)
+                # or just minor jitter due to race conditions in logging (e.g. threads writing out of order)
+                time_diff = last_activity - current_entry_s
+                if time_diff > 12 * 3600:
+                    # Significant jump back in time -> Midnight crossover -> Next Day
+                    day_offset += 86400
+                    current_entry_s = day_offset + second_of_day
+                else:
+                    # Minor jitter/out-of-order write. Keep timeline monotonic to avoid
+                    # negative durations when closing periods later.
+                    current_entry_s = last_activity
+
+            # Skip all entries until we see the first SESSION_START marker
+            # This handles midnight crossover - entries before SESSION_START are from previous day
+            # Single hash probe instead of a chain of string compares per row
+            marker = SESSION_MARKERS.get(process, MARKER_NONE)
+            
+            if not session_started and marker != MARKER_SESSION_START:
+                continue
+            
+            # Handle special markers
+            if marker == MARKER_SESSION_START:
+                session_started = True  # Mark that we've started tracking today's session
+                # Start of work session
+                session_s = current_entry_s
+                
+                if current_session_start is not None:
+                    if in_work_session:
+                        # Close previous work period (shouldn't happen, but be safe)
+                        periods.append((current_session_start, session_s, 'work'))
+                    else:
+                        # Close previous break period
+                        periods.append((current_session_start, session_s, 'break'))
+                
+                current_session_start = session_s
+                in_work_session = True
+                
+                if first_activity is None:
+                    first_activity = session_s
+                last_activity = session_s
+                
+            elif marker == MARKER_BREAK_START:
+                # End of work session, start of break
+                break_s = current_entry_s
+                
+                if current_session_start is not None and in_work_session:
+                    periods.append((current_session_start, break_s, 'work'))
+                    current_session_start = break_s
+                    in_work_session = False
+                else:
+                    # Break without session start (implicit break)
+                    current_session_start = break_s
+                    in_work_session = False
+                
+                last_activity = break_s
+                
+            elif marker == MARKER_SESSION_END:
+                # Explicit end of session
+                end_s = current_entry_s
+                
+                if current_session_start is not None:
+                    if in_work_session:
+                        periods.append((current_session_start, end_s, 'work'))
+                    # No need to track break periods explicitly
+                
+                current_session_start = None
+                in_work_session = False
+                last_activity = end_s
+                
+            else:
+                # Regular activity entry
+                try:
+                    start_s = current_entry_s
+                    
+                    duration_str = row[idx_duration].strip() or '0'
+                    duration = int(duration_str)
+                    
+                    # Track application statistics with window titles (only if session has started)
+                    if session_started and duration > 0:
+                        app_name = process.replace('.exe', '')  # Remove .exe extension
+                        title = row[idx_title].strip()
+                        if title_quoted and title[:1] == '"':
+                            title = _unquote_csv_field(title).strip()
+                        
+                        entry = app_stats[app_name]
+                        entry['total'] += duration
+                        if title:
+                            entry['windows'][title] += duration
+                    
+                    if first_activity is None:
+                        first_activity = start_s
+                    if last_activity is None or start_s > last_activity:
+                        last_activity = start_s
+                    
+                except (ValueError, TypeError, AttributeError):
+                    continue
+        
+        # Close any open session at end of file
+        if current_session_start is not None:
+            end_of_day = last_activity if last_activity is not None else 23 * 3600 + 59 * 60 + 59
+            # For ongoing day, use current time as end
+            if is_today:
+                end_of_day = now_s
+            
+            if in_work_session:
+                periods.append((current_session_start, end_of_day, 'work'))
+            else:
+                # Still in break at end of day - this is normal
+                periods.append((current_session_start, end_of_day, 'break'))
+        
+        # Drop invalid/negative periods that may appear from out-of-order writes
+        periods = [
+            (start, end, period_type)
+            for start, end, period_type in periods
+            if end > start
+        ]
+
+        # Total work time is the sum of the work periods
+        for start, end, period_type in periods:
+            if period_type == 'work':
+                total_work_seconds += end - start
+        
+        # Calculate total break time based on gaps between work sessions (excluding huge gaps like night)
+        # 1. Identify all work intervals
+        work_intervals = sorted([
+            (p[0], p[1]) for p in periods if p[2] == 'work'
+        ], key=lambda x: x[0])
+
+        total_break_seconds = 0
+        
+        if work_intervals:
+            # Update first/last activity based on actual work sessions
+            first_activity = work_intervals[0][0]
+            last_activity = work_intervals[-1][1]
+
+            # Calculate gaps between consecutive work sessions
+            for i in range(len(work_intervals) - 1):
+                end_current = work_intervals[i][1]
+                start_next = work_intervals[i+1][0]
+                
+                gap = start_next - end_current
+                
+                # If gap is huge (e.g. > 4 hours), treat as "Off work" (Night), don't count as break
+                if 0 < gap < (4 * 3600):
+                    total_break_seconds += gap
+                else:
+                    # Treat > 4h gap as non-working time, not break
+                    pass
+        else:
+             # Fallback if no work periods found (should be rare)
+             if first_activity is not None and last_activity is not None:
+                 # For ongoing day, use current time as last_activity
+                 if is_today:
+                     last_activity = max(last_activity, now_s)
+                 
+                 total_day_seconds = last_activity - first_activity
+                 total_break_seconds = max(0, total_day_seconds - total_work_seconds)
+
+        # Reconcile app totals with total work time.
+        # App stats are based on flushed window samples, while total work time may include
+        # still-open active work that has not been flushed to CSV yet.
+        total_app_seconds = sum(app_data['total'] for app_data in app_stats.values())
+        unattributed_seconds = max(0, total_work_seconds - total_app_seconds)
+        if unattributed_seconds > 0:
+            unattributed_entry = app_stats['Unattributed active time']
+            unattributed_entry['total'] += unattributed_seconds
+
+            # Use a synthetic window title to make the source of this time explicit in UI.
+            note_title = 'Open active window (not flushed to log yet)'
+            unattributed_entry['windows'][note_title] += unattributed_seconds
+        
+        # Hand out plain dicts so callers don't silently create entries on lookup
+        app_stats_result: Dict[str, Dict[str, Any]] = {
+            app_name: {'total': app_data['total'], 'windows': dict(app_data['windows'])}
+            for app_name, app_data in app_stats.items()
+        }
+        
+        # Materialize datetimes only for the (small) result set
+        period_times: List[Tuple[datetime, datetime, str]] = [
+            (day_start + timedelta(seconds=start), day_start + timedelta(seconds=end), period_type)
+            for start, end, period_type in periods
+        ]
+        start_time = day_start + timedelta(seconds=first_activity) if first_activity is not None else None
+        end_time = day_start + timedelta(seconds=last_activity) if last_activity is not None else None
+        
+        return {
+            'date': date,
+            'exists': True,
+            'start_time': start_time,
+            'end_time': end_time,
+            'total_work_seconds': total_work_seconds,
+            'total_break_seconds': total_break_seconds,
+            'periods': period_times,
+            'period_seconds': periods,  # Same periods as seconds from midnight of `date`
+            'app_stats': app_stats_result,
+            'error': None
+        }
+    
+    def format_duration(self, seconds: int) -> str:
+        """Format seconds as HH:MM:SS"""
+        hours, rem = divmod(seconds, 3600)
+        minutes, secs = divmod(rem, 60)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    
+    def parse_week(self, start_date: datetime, jobs: int = 1) -> Dict[str, Any]:
+        """Parse logs for a week (7 days starting from start_date)"""
+        week_data = self.parse_range(start_date, 7, jobs)
+        week_data['is_week'] = True
+        return week_data
+    
+    def parse_range(self, start_date: datetime, days: int, jobs: int = 1) -> Dict[str, Any]:
+        """Parse logs for `days` consecutive days starting from start_date
+        
+        With jobs > 1 the days are parsed in that many worker processes - each day's log is
+        independent and parsing is CPU-bound Python. Worker start-up usually costs more than
+        parsing a day, so this only pays off for long ranges of large logs on several cores.
+        """
+        dates = [start_date + timedelta(days=day_offset) for day_offset in range(days)]
+        
+        if jobs > 1 and days > 1:
+            initializer, initargs = worker_initializer or (None, ())
+            with ProcessPoolExecutor(max_workers=min(jobs, days), initializer=initializer,
+                                     initargs=initargs) as executor:
+                daily_reports = list(executor.map(_parse_log_for_date, repeat(self.logs_folder), dates))
+        else:
+            daily_reports = [self.parse_log(current_date) for current_date in dates]
+        
+        range_app_stats: Dict[str, Dict[str, Any]] = {}
+        total_work_seconds = 0
+        total_break_seconds = 0
+        
+        for day_data in daily_reports:
+            if day_data['exists'] and not day_data.get('error'):
+                total_work_seconds += day_data['total_work_seconds']
+                total_break_seconds += day_data['total_break_seconds']
+                
+                # Aggregate app statistics
+                if day_data.get('app_stats'):
+                    for app_name, app_data in day_data['app_stats'].items():
+                        if app_name not in range_app_stats:
+                            range_app_stats[app_name] = {'total': 0, 'windows': {}}
+                        
+                        range_app_stats[app_name]['total'] += app_data['total']
+                        
+                        # Aggregate window titles
+                        for title, seconds in app_data['windows'].items():
+                            if title not in range_app_stats[app_name]['windows']:
+                                range_app_stats[app_name]['windows'][title] = 0
+                            range_app_stats[app_name]['windows'][title] += seconds
+        
+        return {
+            'start_date': start_date,
+            'end_date': start_date + timedelta(days=days - 1),
+            'days': days,
+            'is_week': False,
+            'daily_reports': daily_reports,
+            'total_work_seconds': total_work_seconds,
+            'total_break_seconds': total_break_seconds,
+            'app_stats': range_app_stats
+        }
+    
+    def generate_html_report(self, report_data: Dict[str, Any], output_path: Path,
+                             max_windows: Optional[int] = MAX_WINDOWS_PER_APP) -> Path:
+        """Generate an HTML report matching the screenshot design
+        
+        Only the top `max_windows` window titles are listed per application (None lists all);
+        the remainder is folded into a single summary row.
+        """
+        
+        # Prepare app statistics data
+        app_stats_list = self._build_app_stats_list(report_data.get('app_stats'), max_windows)
+        
+        # Stream HTML straight to disk instead of buffering the whole document
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            self._write_html_report(f.write, report_data, app_stats_list)
+        
+        return output_path
+    
+    def _write_html_report(self, write: Callable[[str], Any], report_data: Dict[str, Any],
+                           app_stats_list: List[Dict[str, Any]]) -> None:
+        """Emit the daily HTML report chunk by chunk through the given write callable"""
+        now = datetime.now()
+        report_date = report_data['date'].strftime('%Y-%m-%d')
+        write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Work / Break Report - {report_date}</title>
+""")
+        write(_DAILY_REPORT_CSS)
+        write("""</head>
 <body>
     <div class="container">
-        <h1>📅 Weekly Work/Break Report</h1>
-        <div class="week-range">{week_data['start_date'].strftime('%B %d')} - {week_data['end_date'].strftime('%B %d, %Y')}</div>
+        <h1>Work / Break Report</h1>
+        
+""")
+        
+        if report_data.get('error'):
+            write(f"        <div class='error'>{escape(report_data['error'])}</div>\n")
+        else:
+            start_time = report_data['start_time'].strftime('%H:%M:%S') if report_data['start_time'] else '—'
+            end_time = report_data['end_time'].strftime('%H:%M:%S') if report_data['end_time'] else '—'
+            write(f"""        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-label">Start Time</div>
+                <div class="stat-value">{start_time}</div>
+            </div>
+            
+            <div class="stat-card">
+                <div class="stat-label">End Time</div>
+                <div class="stat-value">{end_time}</div>
+            </div>
+            
+            <div class="stat-card">
+                <div class="stat-label">Total Work Time</div>
+                <div class="stat-value">{self.format_duration(report_data['total_work_seconds'])}</div>
+            </div>
+            
+            <div class="stat-card">
+                <div class="stat-label">Total Break Time</div>
+                <div class="stat-value">{self.format_duration(report_data['total_break_seconds'])}</div>
+            </div>
+        </div>
+        
+        <div class="timeline-container">
+            <div class="timeline-wrapper">
+                <div class="timeline-bar">
+""")
+            # Timeline covers the logical day 03:00 -> 03:00 next day, in seconds from midnight
+            timeline_start_hour = 3
+            window_start = timeline_start_hour * 3600
+            window_end = window_start + 86400
+            for start, end, period_type in report_data['period_seconds']:
+                # Keep only the portion that belongs to the selected calendar day.
+                clipped_start = max(start, window_start)
+                clipped_end = min(end, window_end)
+                
+                if clipped_end <= clipped_start:
+                    continue
+                
+                write(_PERIOD_TMPL.format(
+                    type=period_type,
+                    left=_pct(clipped_start - window_start, 86400),
+                    width=_pct(clipped_end - clipped_start, 86400),
+                    label=period_type.title(),
+                    start=self.format_duration(clipped_start % 86400),
+                    end=self.format_duration(clipped_end % 86400),
+                    duration=self.format_duration(clipped_end - clipped_start)
+                ))
+            write("""                </div>
+            </div>
+            
+            <div class="timeline-labels">
+""")
+            for h in range(0, 25, 1):
+                label_class = 'timeline-label start' if h == 0 else 'timeline-label end' if h == 24 else 'timeline-label'
+                write(
+                    f'                <div class="{label_class}" style="left: {_pct(h, 24, 4)}%;">'
+                    f'{((timeline_start_hour + h) % 24):02d}:00</div>\n'
+                )
+            
+            capped_note = ''
+            if report_data['end_time'] and report_data['end_time'].date() == now.date():
+                capped_note = ('• Capped at now: ' + now.strftime('%H:%M:%S') +
+                               ' • Breaks after the last break start are excluded (day ended).')
+            write(f"""            </div>
+            
+            <div class="legend">
+                <div class="legend-item">
+                    <div class="legend-color work"></div>
+                    <span>Work Time</span>
+                </div>
+                <div class="legend-item">
+                    <div class="legend-color break"></div>
+                    <span>Break Time</span>
+                </div>
+            </div>
+            
+            <div class="note">
+                Report generated: {now.strftime('%Y-%m-%d %H:%M:%S')}
+                {capped_note}
+            </div>
+        </div>
+        
+""")
+            
+            if app_stats_list:
+                write("""        <div class="timeline-container app-stats">
+            <h2>📊 Application Usage Statistics</h2>
+            <div class="app-list">
+""")
+                self._write_app_list(write, app_stats_list)
+                write("""            </div>
+        </div>
+        
+        <script>
+            function toggleAppDetails(element) {
+                element.classList.toggle('expanded');
+                const details = element.nextElementSibling;
+                if (details && details.classList.contains('window-details')) {
+                    details.classList.toggle('visible');
+                }
+            }
+        </script>
+""")
+        
+        write("""    </div>
+</body>
+</html>
+""")
+    
+    def _build_app_stats_list(self, app_stats: Optional[Dict[str, Dict[str, Any]]],
+                              max_windows: Optional[int]) -> List[Dict[str, Any]]:
+        """Flatten app_stats into render-ready rows sorted by time, with at most `max_windows` titles per app"""
+        if not app_stats:
+            return []
+        
+        # Only show apps with recorded time; total them in the same pass
+        active_apps = [(app_name, app_data) for app_name, app_data in app_stats.items() if app_data['total'] > 0]
+        total_app_time = sum(app_data['total'] for _, app_data in active_apps)
+        
+        # Sort by time descending
+        active_apps.sort(key=lambda x: x[1]['total'], reverse=True)
+        
+        app_stats_list = []
+        for app_name, app_data in active_apps:
+            seconds = app_data['total']
+            percentage = _pct(seconds, total_app_time, 1)
+            
+            # Sort window titles by time, keeping only the top ones when capped
+            window_items = app_data['windows'].items()
+            if max_windows is not None and len(window_items) > max_windows:
+                top_windows = heapq.nlargest(max_windows, window_items, key=itemgetter(1))
+            else:
+                top_windows = sorted(window_items, key=itemgetter(1), reverse=True)
+            
+            windows = []
+            for title, title_seconds in top_windows:
+                # Inlined format_duration - this loop runs once per window title
+                hours, rem = divmod(title_seconds, 3600)
+                minutes, secs = divmod(rem, 60)
+                windows.append({
+                    'title': title,
+                    'seconds': title_seconds,
+                    'formatted_time': f"{hours:02d}:{minutes:02d}:{secs:02d}",
+                    'percentage': _pct(title_seconds, seconds, 1)
+                })
+            
+            hidden_count = len(window_items) - len(top_windows)
+            if hidden_count > 0:
+                hidden_seconds = sum(app_data['windows'].values()) - sum(w['seconds'] for w in windows)
+                windows.append({
+                    'title': f"({hidden_count} more windows)",
+                    'seconds': hidden_seconds,
+                    'formatted_time': self.format_duration(hidden_seconds),
+                    'percentage': _pct(hidden_seconds, seconds, 1)
+                })
+            
+            app_stats_list.append({
+                'name': app_name,
+                'seconds': seconds,
+                'formatted_time': self.format_duration(seconds),
+                'percentage': percentage,
+                'windows': windows
+            })
+        
+        return app_stats_list
+    
+    def _write_app_list(self, write: Callable[[str], Any], app_stats_list: List[Dict[str, Any]]) -> None:
+        """Emit the expandable per-application rows shared by the daily and weekly reports"""
+        for app in app_stats_list:
+            write(f"""                <div>
+                    <div class="app-item" onclick="toggleAppDetails(this)">
+                        <span class="expand-icon">▶</span>
+                        <div class="app-name" title="{_esc(app["name"])}">{_esc(app["name"])}</div>
+                        <div class="app-time">{app["formatted_time"]}</div>
+                        <div class="app-bar">
+                            <div class="app-bar-fill" style="width: {app["percentage"]}%;"></div>
+                        </div>
+                        <div class="app-percentage">{app["percentage"]}%</div>
+                    </div>
+""")
+            if app["windows"]:
+                write('                    <div class="window-details">\n')
+                for window in app["windows"]:
+                    write(f"""                        <div class="window-item">
+                            <div class="window-title" title="{_esc(window["title"])}">{_esc(window["title"])}</div>
+                            <div class="window-time">{window["formatted_time"]}</div>
+                            <div class="window-bar">
+                                <div class="window-bar-fill" style="width: {window["percentage"]}%;"></div>
+                            </div>
+                            <div class="window-percentage">{window["percentage"]}%</div>
+                        </div>
+""")
+                write('                    </div>\n')
+            write('                </div>\n')
+    
+    def generate_weekly_html_report(self, week_data: Dict[str, Any], output_path: Path,
+                                    max_windows: Optional[int] = MAX_WINDOWS_PER_APP) -> Path:
+        """Generate a weekly HTML report
+        
+        Window titles are capped per application the same way as in generate_html_report.
+        """
+        
+        # Prepare daily summary data
+        daily_summaries = []
+        for day_data in week_data['daily_reports']:
+            if day_data['exists'] and not day_data.get('error'):
+                daily_summaries.append({
+                    'date': day_data['date'].strftime('%Y-%m-%d'),
+                    'weekday': day_data['date'].strftime('%A'),
+                    'work_time': self.format_duration(day_data['total_work_seconds']),
+                    'break_time': self.format_duration(day_data['total_break_seconds']),
+                    'work_seconds': day_data['total_work_seconds'],
+                    'break_seconds': day_data['total_break_seconds']
+                })
+        
+        # Prepare app statistics data
+        app_stats_list = self._build_app_stats_list(week_data.get('app_stats'), max_windows)
+        
+        # Stream HTML straight to disk instead of buffering the whole document
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            self._write_weekly_html_report(f.write, week_data, daily_summaries, app_stats_list)
+        
+        return output_path
+    
+    def _write_weekly_html_report(self, write: Callable[[str], Any], week_data: Dict[str, Any],
+                                  daily_summaries: List[Dict[str, Any]], app_stats_list: List[Dict[str, Any]]) -> None:
+        """Emit the weekly HTML report chunk by chunk through the given write callable"""
+        start_date = week_data['start_date']
+        end_date = week_data['end_date']
+        days = week_data.get('days', 7)
+        is_week = week_data.get('is_week', False)
+        report_title = 'Weekly Work/Break Report' if is_week else f'{days}-Day Work/Break Report'
+        write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{report_title} - {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}</title>
+""")
+        write(_WEEKLY_REPORT_CSS)
+        write(f"""</head>
+<body>
+    <div class="container">
+        <h1>📅 {report_title}</h1>
+        <div class="week-range">{start_date.strftime('%B %d')} - {end_date.strftime('%B %d, %Y')}</div>
         
         <div class="stats-grid">
             <div class="stat-card">
@@ -1256,7 +1403,7 @@ class ActivityReport:
             
             <div class="stat-card">
                 <div class="stat-label">Avg Work/Day</div>
-                <div class="stat-value">{self.format_duration(week_data['total_work_seconds'] // 7)}</div>
+                <div class="stat-value">{self.format_duration(week_data['total_work_seconds'] // days)}</div>
             </div>
             
             <div class="stat-card">
@@ -1277,55 +1424,33 @@ class ActivityReport:
                     </tr>
                 </thead>
                 <tbody>
-                    {"".join([
-                        f'''<tr>
+""")
+        for day in daily_summaries:
+            write(f"""                    <tr>
                         <td>{day['date']}</td>
                         <td>{day['weekday']}</td>
                         <td class="mono">{day['work_time']}</td>
                         <td class="mono">{day['break_time']}</td>
-                    </tr>'''
-                        for day in daily_summaries
-                    ])}
-                </tbody>
+                    </tr>
+""")
+        write("""                </tbody>
             </table>
         </div>
         
-        {"" if not app_stats_list else f'''
-        <div class="daily-container app-stats">
-            <h2>📱 Application Usage Statistics (Week Total)</h2>
+""")
+        
+        if app_stats_list:
+            write(f"""        <div class="daily-container app-stats">
+            <h2>📱 Application Usage Statistics ({'Week' if is_week else 'Period'} Total)</h2>
             <div class="app-list">
-                {"".join([
-                    f'''<div>
-                    <div class="app-item" onclick="toggleAppDetails(this)">
-                        <span class="expand-icon">▶</span>
-                        <div class="app-name" title="{app["name"]}">{app["name"]}</div>
-                        <div class="app-time">{app["formatted_time"]}</div>
-                        <div class="app-bar">
-                            <div class="app-bar-fill" style="width: {app["percentage"]:.1f}%;"></div>
-                        </div>
-                        <div class="app-percentage">{app["percentage"]:.1f}%</div>
-                    </div>
-                    {"" if not app["windows"] else f'''<div class="window-details">
-                        {"".join([
-                            f'''<div class="window-item">
-                                <div class="window-title" title="{window["title"]}">{window["title"]}</div>
-                                <div class="window-time">{window["formatted_time"]}</div>
-                                <div class="window-bar">
-                                    <div class="window-bar-fill" style="width: {window["percentage"]:.1f}%;"></div>
-                                </div>
-                                <div class="window-percentage">{window["percentage"]:.1f}%</div>
-                            </div>'''
-                            for window in app["windows"]
-                        ])}
-                    </div>'''}
-                </div>'''
-                    for app in app_stats_list
-                ])}
-            </div>
+""")
+            self._write_app_list(write, app_stats_list)
+            write("""            </div>
         </div>
-        '''}
         
-        <div class="note">
+""")
+        
+        write(f"""        <div class="note">
             Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         </div>
         
@@ -1341,17 +1466,15 @@ class ActivityReport:
     </div>
 </body>
 </html>
-"""
-        
-        # Write HTML file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return output_path
+""")
+
 
+def _parse_log_for_date(logs_folder: Path, date: datetime) -> Dict[str, Any]:
+    """Parse one day's log - module-level so it can be pickled for ProcessPoolExecutor"""
+    return ActivityReport(logs_folder).parse_log(date)
 
-def main():
+
+def main() -> int:
     """Main entry point for the report generator"""
     # Fix encoding for Windows console
     import sys
@@ -1364,26 +1487,34 @@ def main():
     parser = argparse.ArgumentParser(
         description='Generate Work/Break reports from StandUpTracker logs'
     )
-    parser.add_argument(
+    # Each of these picks the report period; at most one may be given
+    period_group = parser.add_mutually_exclusive_group()
+    period_group.add_argument(
         '--yesterday',
         action='store_true',
         help='Generate report for yesterday'
     )
-    parser.add_argument(
+    period_group.add_argument(
         '--date',
         type=str,
         help='Generate report for specific date (YYYY-MM-DD)'
     )
-    parser.add_argument(
+    period_group.add_argument(
         '--week',
         action='store_true',
         help='Generate weekly report for current week (Monday-Sunday)'
     )
-    parser.add_argument(
+    period_group.add_argument(
         '--last-week',
         action='store_true',
         help='Generate weekly report for last week'
     )
+    period_group.add_argument(
+        '--range',
+        type=int,
+        metavar='N',
+        help='Generate a summary report for the last N days, including today'
+    )
     parser.add_argument(
         '--output',
         type=str,
@@ -1394,11 +1525,36 @@ def main():
         action='store_true',
         help='Do not open the report in browser'
     )
+    parser.add_argument(
+        '--max-windows',
+        type=int,
+        default=MAX_WINDOWS_PER_APP,
+        help=f'Window titles listed per application, 0 for all (default: {MAX_WINDOWS_PER_APP})'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Parse the days of weekly and --range reports in N worker processes (default: 1)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate the daily report even if it is newer than the log file and the generator'
+    )
     
     args = parser.parse_args()
     
+    if args.range is not None and args.range < 1:
+        parser.error('--range must be at least 1')
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.max_windows < 0:
+        parser.error('--max-windows must be 0 or more')
+    
     # Get logs folder
-    logs_folder = Path(os.getenv('LOCALAPPDATA')) / 'StandUpTracker' / 'logs'
+    logs_folder = Path(os.getenv('LOCALAPPDATA', '')) / 'StandUpTracker' / 'logs'
     
     if not logs_folder.exists():
         print(f"Error: Logs folder not found: {logs_folder}")
@@ -1407,33 +1563,47 @@ def main():
     
     reporter = ActivityReport(logs_folder)
     
-    # Handle weekly reports
-    if args.week or args.last_week:
-        # Calculate Monday of target week
+    # Handle weekly and multi-day reports
+    if args.week or args.last_week or args.range:
         today = datetime.now()
-        days_since_monday = (today.weekday()) % 7
-        this_monday = today - timedelta(days=days_since_monday)
         
-        if args.last_week:
-            start_date = this_monday - timedelta(days=7)
+        if args.range:
+            days = args.range
+            start_date = today - timedelta(days=days - 1)
+            report_kind = f"{days}-day"
         else:
-            start_date = this_monday
+            # Calculate Monday of target week
+            days = 7
+            days_since_monday = (today.weekday()) % 7
+            this_monday = today - timedelta(days=days_since_monday)
+            
+            if args.last_week:
+                start_date = this_monday - timedelta(days=7)
+            else:
+                start_date = this_monday
+            report_kind = "weekly"
         
-        print(f"Generating weekly report for {start_date.strftime('%Y-%m-%d')} to {(start_date + timedelta(days=6)).strftime('%Y-%m-%d')}...")
+        print(f"Generating {report_kind} report for {start_date.strftime('%Y-%m-%d')} to {(start_date + timedelta(days=days - 1)).strftime('%Y-%m-%d')}...")
         
-        week_data = reporter.parse_week(start_date)
+        if args.range:
+            week_data = reporter.parse_range(start_date, days, args.jobs)
+        else:
+            week_data = reporter.parse_week(start_date, args.jobs)
         
         # Determine output path
         if args.output:
             output_path = Path(args.output)
         else:
-            reports_folder = Path(os.getenv('LOCALAPPDATA')) / 'StandUpTracker' / 'reports'
-            output_path = reports_folder / f"weekly_report_{start_date.strftime('%Y-%m-%d')}.html"
+            reports_folder = Path(os.getenv('LOCALAPPDATA', '')) / 'StandUpTracker' / 'reports'
+            if args.range:
+                output_path = reports_folder / f"range_report_{start_date.strftime('%Y-%m-%d')}_{days}d.html"
+            else:
+                output_path = reports_folder / f"weekly_report_{start_date.strftime('%Y-%m-%d')}.html"
         
         # Generate HTML
-        output_file = reporter.generate_weekly_html_report(week_data, output_path)
+        output_file = reporter.generate_weekly_html_report(week_data, output_path, max_windows=args.max_windows or None)
         
-        print(f"[OK] Weekly report generated: {output_file}")
+        print(f"[OK] {report_kind.capitalize()} report generated: {output_file}")
         print(f"  Period: {week_data['start_date'].strftime('%Y-%m-%d')} to {week_data['end_date'].strftime('%Y-%m-%d')}")
         print(f"  Total Work: {reporter.format_duration(week_data['total_work_seconds'])}")
         print(f"  Total Break: {reporter.format_duration(week_data['total_break_seconds'])}")
@@ -1459,20 +1629,40 @@ def main():
     else:
         target_date = datetime.now()
     
-    # Generate report
-    print(f"Generating report for {target_date.strftime('%Y-%m-%d')}...")
-    
-    report_data = reporter.parse_log(target_date)
-    
     # Determine output path
     if args.output:
         output_path = Path(args.output)
     else:
-        reports_folder = Path(os.getenv('LOCALAPPDATA')) / 'StandUpTracker' / 'reports'
+        reports_folder = Path(os.getenv('LOCALAPPDATA', '')) / 'StandUpTracker' / 'reports'
         output_path = reports_folder / f"report_{target_date.strftime('%Y-%m-%d')}.html"
     
+    # Reuse the existing report if neither the log nor this generator changed since it was
+    # written. Only default reports qualify: a custom --output may hold another date's report
+    # and a non-default --max-windows renders differently. The report must also postdate the
+    # end of the logical day (03:00 next day, when the logger rotates) - one rendered earlier
+    # capped open sessions at the time it was generated.
+    log_path = reporter.get_log_path(target_date)
+    logical_day_end = datetime(target_date.year, target_date.month, target_date.day) + timedelta(days=1, hours=3)
+    if (not args.force and not args.output and args.max_windows == MAX_WINDOWS_PER_APP
+            and log_path.exists() and output_path.exists()
+            and output_path.stat().st_mtime >= max(log_path.stat().st_mtime,
+                                                   Path(__file__).stat().st_mtime,
+                                                   logical_day_end.timestamp())):
+        print(f"[OK] Report is up to date: {output_path}")
+        
+        if not args.no_open:
+            print(f"\nOpening report in browser...")
+            webbrowser.open(output_path.as_uri())
+        
+        return 0
+    
+    # Generate report
+    print(f"Generating report for {target_date.strftime('%Y-%m-%d')}...")
+    
+    report_data = reporter.parse_log(target_date)
+    
     # Generate HTML
-    output_file = reporter.generate_html_report(report_data, output_path)
+    output_file = reporter.generate_html_report(report_data, output_path, max_windows=args.max_windows or None)
     
     print(f"[OK] Report generated: {output_file}")
     
@@ -0,0 +1,66 @@
+"""
+StandUpTracker Report Generator launcher
+
+Runs the mypyc-compiled build of report_generator (see README) when one sits next to
+this script and is newer than report_generator.py; otherwise runs the pure-Python code.
+Takes the same arguments as report_generator.py.
+
+Usage:
+    python run_report.py --yesterday
+"""
+
+import sys
+import importlib.util
+from importlib.machinery import EXTENSION_SUFFIXES
+from pathlib import Path
+from types import ModuleType
+
+
+def _load_module(module_path: Path) -> ModuleType:
+    """Import the file at module_path under the name report_generator"""
+    spec = importlib.util.spec_from_file_location('report_generator', module_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing so functions defined in it pickle as report_generator.<name>
+    sys.modules['report_generator'] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules['report_generator']
+        raise
+    return module
+
+
+def load_report_generator() -> ModuleType:
+    """Import report_generator, preferring an up-to-date compiled extension over the source
+    
+    Worker processes started for --jobs load the same file: a spawned worker would otherwise
+    import report_generator by name, and Python's finder always prefers the compiled build,
+    even a stale one.
+    """
+    script_dir = Path(__file__).resolve().parent
+    source_path = script_dir / 'report_generator.py'
+    source_mtime = source_path.stat().st_mtime
+    
+    for suffix in EXTENSION_SUFFIXES:
+        module_path = script_dir / f"report_generator{suffix}"
+        # A build older than the script is stale - run the source rather than old code
+        if not module_path.exists() or module_path.stat().st_mtime < source_mtime:
+            continue
+        try:
+            module = _load_module(module_path)
+        except ImportError:
+            # Built for another Python version or platform
+            continue
+        break
+    else:
+        module_path = source_path
+        module = _load_module(module_path)
+    
+    setattr(module, 'worker_initializer', (_load_module, (module_path,)))
+    return module
+
+
+if __name__ == '__main__':
+    sys.exit(load_report_generator().main())